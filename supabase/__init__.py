@@ -3,7 +3,9 @@ from postgrest import APIResponse as PostgrestAPIResponse
 from storage3.utils import StorageException
 
 from .__version__ import __version__
+from .async_client import AsyncClient, create_async_client
 from .client import Client, create_client
-from .lib.auth_client import SupabaseAuthClient
+from .lib.auth_client import AsyncSupabaseAuthClient, SupabaseAuthClient
+from .lib.postgrest_client import AsyncSupabasePostgrestClient, SupabasePostgrestClient
 from .lib.realtime_client import SupabaseRealtimeClient
-from .lib.storage_client import SupabaseStorageClient
+from .lib.storage_client import AsyncSupabaseStorageClient, SupabaseStorageClient
@@ -0,0 +1,162 @@
+from typing import Any, Dict, Optional, Union
+
+from httpx import AsyncBaseTransport
+from httpx import AsyncClient as AsyncHTTPClient
+from httpx import AsyncHTTPTransport, Timeout
+from postgrest import AsyncFilterRequestBuilder, AsyncRequestBuilder
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
+from storage3.constants import DEFAULT_TIMEOUT as DEFAULT_STORAGE_CLIENT_TIMEOUT
+
+from .lib.auth_client import AsyncSupabaseAuthClient
+from .lib.base_client import AsyncSharedTransport, SupabaseClientBase
+from .lib.client_options import AsyncClientOptions
+from .lib.postgrest_client import AsyncSupabasePostgrestClient
+from .lib.storage_client import AsyncSupabaseStorageClient
+
+
+class AsyncClient(
+    SupabaseClientBase[
+        AsyncClientOptions,
+        AsyncSharedTransport,
+        AsyncSupabaseAuthClient,
+        AsyncSupabasePostgrestClient,
+        AsyncSupabaseStorageClient,
+    ]
+):
+    """Supabase async client class."""
+
+    __slots__ = ()
+
+    _options_class = AsyncClientOptions
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connections shared by the sub-clients."""
+        if self._transport is not None:
+            await self._transport.transport.aclose()
+
+    def table(self, table_name: str) -> AsyncRequestBuilder:
+        """Perform a table operation.
+
+        Note that the supabase client uses the `from` method, but in Python,
+        this is a reserved keyword, so we have elected to use the name `table`.
+        Alternatively you can use the `.from_()` method.
+        """
+        return self.from_(table_name)
+
+    def from_(self, table_name: str) -> AsyncRequestBuilder:
+        """Perform a table operation.
+
+        See the `table` method.
+        """
+        return self.postgrest.from_(table_name)
+
+    async def rpc(self, fn: str, params: Dict[Any, Any]) -> AsyncFilterRequestBuilder:
+        """Performs a stored procedure call.
+
+        Parameters
+        ----------
+        fn : callable
+            The stored procedure call to be executed.
+        params : dict of any
+            Parameters passed into the stored procedure call.
+
+        Returns
+        -------
+        AsyncFilterRequestBuilder
+            Returns a filter builder. This lets you apply filters on the response
+            of an RPC.
+        """
+        return await self.postgrest.rpc(fn, params)
+
+    def _create_transport(self) -> AsyncSharedTransport:
+        return AsyncSharedTransport(AsyncHTTPTransport(http2=True))
+
+    @staticmethod
+    def _init_storage_client(
+        storage_url: str,
+        headers: Dict[str, str],
+        storage_client_timeout: int = DEFAULT_STORAGE_CLIENT_TIMEOUT,
+        transport: Optional[AsyncBaseTransport] = None,
+    ) -> AsyncSupabaseStorageClient:
+        return AsyncSupabaseStorageClient(
+            storage_url, headers, storage_client_timeout, transport=transport
+        )
+
+    @staticmethod
+    def _init_supabase_auth_client(
+        auth_url: str,
+        client_options: AsyncClientOptions,
+        transport: Optional[AsyncBaseTransport] = None,
+    ) -> AsyncSupabaseAuthClient:
+        """Creates a wrapped instance of the async GoTrue Client."""
+        return AsyncSupabaseAuthClient(
+            url=auth_url,
+            auto_refresh_token=client_options.auto_refresh_token,
+            persist_session=client_options.persist_session,
+            storage=client_options.storage,
+            headers=client_options.headers,
+            http_client=AsyncHTTPClient(transport=transport),
+        )
+
+    @staticmethod
+    def _init_postgrest_client(
+        rest_url: str,
+        supabase_key: str,
+        headers: Dict[str, str],
+        schema: str,
+        timeout: Union[int, float, Timeout] = DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+        transport: Optional[AsyncBaseTransport] = None,
+    ) -> AsyncSupabasePostgrestClient:
+        """Private helper for creating an instance of the async Postgrest client."""
+        client = AsyncSupabasePostgrestClient(
+            rest_url,
+            headers=headers,
+            schema=schema,
+            timeout=timeout,
+            transport=transport,
+        )
+        client.auth(token=supabase_key)
+        return client
+
+
+def create_async_client(
+    supabase_url: str,
+    supabase_key: str,
+    options: Optional[AsyncClientOptions] = None,
+) -> AsyncClient:
+    """Create an async client, the asyncio counterpart of `create_client`.
+
+    Parameters
+    ----------
+    supabase_url: str
+        The URL to the Supabase instance that should be connected to.
+    supabase_key: str
+        The API key to the Supabase instance that should be connected to.
+    **options
+        Any extra settings to be optionally specified - also see the
+        `DEFAULT_OPTIONS` dict.
+
+    Examples
+    --------
+    Instantiating the client and running a query.
+    >>> import os
+    >>> from supabase import create_async_client, AsyncClient
+    >>>
+    >>> url: str = os.environ.get("SUPABASE_TEST_URL")
+    >>> key: str = os.environ.get("SUPABASE_TEST_KEY")
+    >>> async with create_async_client(url, key) as supabase:
+    ...     response = await supabase.table("countries").select("*").execute()
+
+    Returns
+    -------
+    AsyncClient
+    """
+    return AsyncClient(
+        supabase_url=supabase_url, supabase_key=supabase_key, options=options
+    )
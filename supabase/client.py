@@ -1,103 +1,47 @@
-import re
-from typing import Any, Dict, Union
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
 
-from httpx import Timeout
-from postgrest import SyncFilterRequestBuilder, SyncPostgrestClient, SyncRequestBuilder
+from httpx import BaseTransport, HTTPTransport, Timeout
+from postgrest import SyncFilterRequestBuilder, SyncRequestBuilder
 from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
 from storage3.constants import DEFAULT_TIMEOUT as DEFAULT_STORAGE_CLIENT_TIMEOUT
-from supafunc import FunctionsClient
 
-from .lib.auth_client import SupabaseAuthClient
+from .lib.auth_client import SupabaseAuthClient, SyncClient
+from .lib.base_client import SupabaseException  # noqa: F401 - re-exported
+from .lib.base_client import SharedTransport, SupabaseClientBase
 from .lib.client_options import ClientOptions
+from .lib.postgrest_client import SupabasePostgrestClient
 from .lib.storage_client import SupabaseStorageClient
 
+_CLIENT_CACHE_SIZE = 32
 
-# Create an exception class when user does not provide a valid url or key.
-class SupabaseException(Exception):
-    def __init__(self, message: str):
-        self.message = message
-        super().__init__(self.message)
 
-
-class Client:
+class Client(
+    SupabaseClientBase[
+        ClientOptions,
+        SharedTransport,
+        SupabaseAuthClient,
+        SupabasePostgrestClient,
+        SupabaseStorageClient,
+    ]
+):
     """Supabase client class."""
 
-    def __init__(
-        self,
-        supabase_url: str,
-        supabase_key: str,
-        options: ClientOptions = ClientOptions(),
-    ):
-        """Instantiate the client.
+    __slots__ = ()
 
-        Parameters
-        ----------
-        supabase_url: str
-            The URL to the Supabase instance that should be connected to.
-        supabase_key: str
-            The API key to the Supabase instance that should be connected to.
-        **options
-            Any extra settings to be optionally specified - also see the
-            `DEFAULT_OPTIONS` dict.
-        """
+    _options_class = ClientOptions
 
-        if not supabase_url:
-            raise SupabaseException("supabase_url is required")
-        if not supabase_key:
-            raise SupabaseException("supabase_key is required")
-
-        # Check if the url and key are valid
-        if not re.match(r"^(https?)://.+", supabase_url):
-            raise SupabaseException("Invalid URL")
-
-        # Check if the key is a valid JWT
-        if not re.match(
-            r"^[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*$", supabase_key
-        ):
-            raise SupabaseException("Invalid API key")
-
-        self.supabase_url = supabase_url
-        self.supabase_key = supabase_key
-        options.headers.update(self._get_auth_headers())
-        self.rest_url: str = f"{supabase_url}/rest/v1"
-        self.realtime_url: str = f"{supabase_url}/realtime/v1".replace("http", "ws")
-        self.auth_url: str = f"{supabase_url}/auth/v1"
-        self.storage_url = f"{supabase_url}/storage/v1"
-        is_platform = re.search(r"(supabase\.co)|(supabase\.in)", supabase_url)
-        if is_platform:
-            url_parts = supabase_url.split(".")
-            self.functions_url = (
-                f"{url_parts[0]}.functions.{url_parts[1]}.{url_parts[2]}"
-            )
-
-        else:
-            self.functions_url = f"{supabase_url}/functions/v1"
-        self.schema: str = options.schema
-
-        # Instantiate clients.
-        self.auth = self._init_supabase_auth_client(
-            auth_url=self.auth_url,
-            client_options=options,
-        )
-        # TODO: Bring up to parity with JS client.
-        # self.realtime: SupabaseRealtimeClient = self._init_realtime_client(
-        #     realtime_url=self.realtime_url,
-        #     supabase_key=self.supabase_key,
-        # )
-        self.realtime = None
-        self.postgrest = self._init_postgrest_client(
-            rest_url=self.rest_url,
-            supabase_key=self.supabase_key,
-            headers=options.headers,
-            schema=options.schema,
-            timeout=options.postgrest_client_timeout,
-        )
-        self.storage = self._init_storage_client(
-            self.storage_url, self._get_auth_headers(), options.storage_client_timeout
-        )
+    def __enter__(self) -> "Client":
+        return self
 
-    def functions(self) -> FunctionsClient:
-        return FunctionsClient(self.functions_url, self._get_auth_headers())
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections shared by the sub-clients."""
+        if self._transport is not None:
+            self._transport.transport.close()
 
     def table(self, table_name: str) -> SyncRequestBuilder:
         """Perform a table operation.
@@ -133,6 +77,9 @@ class Client:
         """
         return self.postgrest.rpc(fn, params)
 
+    def _create_transport(self) -> SharedTransport:
+        return SharedTransport(HTTPTransport(http2=True))
+
     #     async def remove_subscription_helper(resolve):
     #         try:
     #             await self._close_subscription(subscription)
@@ -173,13 +120,17 @@ class Client:
         storage_url: str,
         headers: Dict[str, str],
         storage_client_timeout: int = DEFAULT_STORAGE_CLIENT_TIMEOUT,
+        transport: Optional[BaseTransport] = None,
     ) -> SupabaseStorageClient:
-        return SupabaseStorageClient(storage_url, headers, storage_client_timeout)
+        return SupabaseStorageClient(
+            storage_url, headers, storage_client_timeout, transport=transport
+        )
 
     @staticmethod
     def _init_supabase_auth_client(
         auth_url: str,
         client_options: ClientOptions,
+        transport: Optional[BaseTransport] = None,
     ) -> SupabaseAuthClient:
         """Creates a wrapped instance of the GoTrue Client."""
         return SupabaseAuthClient(
@@ -188,6 +139,7 @@ class Client:
             persist_session=client_options.persist_session,
             storage=client_options.storage,
             headers=client_options.headers,
+            http_client=SyncClient(transport=transport),
         )
 
     @staticmethod
@@ -197,27 +149,54 @@ class Client:
         headers: Dict[str, str],
         schema: str,
         timeout: Union[int, float, Timeout] = DEFAULT_POSTGREST_CLIENT_TIMEOUT,
-    ) -> SyncPostgrestClient:
+        transport: Optional[BaseTransport] = None,
+    ) -> SupabasePostgrestClient:
         """Private helper for creating an instance of the Postgrest client."""
-        client = SyncPostgrestClient(
-            rest_url, headers=headers, schema=schema, timeout=timeout
+        client = SupabasePostgrestClient(
+            rest_url,
+            headers=headers,
+            schema=schema,
+            timeout=timeout,
+            transport=transport,
         )
         client.auth(token=supabase_key)
         return client
 
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Helper method to get auth headers."""
-        # What's the corresponding method to get the token
-        return {
-            "apiKey": self.supabase_key,
-            "Authorization": f"Bearer {self.supabase_key}",
-        }
+
+# Clients handed out by `create_client(..., cached=True)`, most recently used
+# last. Options are matched by identity, so each entry keeps its options object
+# alive to stop the `id()` from being reused.
+_CachedClient = Tuple[Optional[ClientOptions], Client]
+_client_cache: "OrderedDict[Tuple[str, str, int], _CachedClient]" = OrderedDict()
+_client_cache_lock = Lock()
+
+
+def _get_cached_client(
+    supabase_url: str, supabase_key: str, options: Optional[ClientOptions]
+) -> Client:
+    """Return the cached client for these arguments, creating it if needed."""
+    cache_key = (supabase_url, supabase_key, id(options))
+    with _client_cache_lock:
+        entry = _client_cache.get(cache_key)
+        if entry is not None:
+            _client_cache.move_to_end(cache_key)
+            return entry[1]
+    client = Client(
+        supabase_url=supabase_url, supabase_key=supabase_key, options=options
+    )
+    with _client_cache_lock:
+        _, client = _client_cache.setdefault(cache_key, (options, client))
+        if len(_client_cache) > _CLIENT_CACHE_SIZE:
+            _client_cache.popitem(last=False)
+    return client
 
 
 def create_client(
     supabase_url: str,
     supabase_key: str,
-    options: ClientOptions = ClientOptions(),
+    options: Optional[ClientOptions] = None,
+    *,
+    cached: bool = False,
 ) -> Client:
     """Create client function to instantiate supabase client like JS runtime.
 
@@ -230,6 +209,12 @@ def create_client(
     **options
         Any extra settings to be optionally specified - also see the
         `DEFAULT_OPTIONS` dict.
+    cached: bool
+        Return the client created by an earlier call with the same URL, key
+        and options object (matched by identity) instead of building a new
+        one, so its connection pool is reused. Up to 32 clients are kept.
+        The auth session is shared as well, so signing in on a cached client
+        affects every caller that gets it.
 
     Examples
     --------
@@ -245,4 +230,6 @@ def create_client(
     -------
     Client
     """
+    if cached:
+        return _get_cached_client(supabase_url, supabase_key, options)
     return Client(supabase_url=supabase_url, supabase_key=supabase_key, options=options)
@@ -1,6 +1,14 @@
 from typing import Dict, Union
 
-from gotrue import SyncGoTrueClient, SyncMemoryStorage, SyncSupportedStorage
+from gotrue import (
+    AsyncGoTrueClient,
+    AsyncMemoryStorage,
+    AsyncSupportedStorage,
+    SyncGoTrueClient,
+    SyncMemoryStorage,
+    SyncSupportedStorage,
+)
+from gotrue.http_clients import AsyncClient
 
 # TODO - export this from GoTrue-py in next release
 from httpx import Client as BaseClient
@@ -36,3 +44,30 @@ class SupabaseAuthClient(SyncGoTrueClient):
             storage=storage,
             http_client=http_client,
         )
+
+
+class AsyncSupabaseAuthClient(AsyncGoTrueClient):
+    """AsyncSupabaseAuthClient"""
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        headers: Dict[str, str] = {},
+        storage_key: Union[str, None] = None,
+        auto_refresh_token: bool = True,
+        persist_session: bool = True,
+        storage: AsyncSupportedStorage = AsyncMemoryStorage(),
+        http_client: Union[AsyncClient, None] = None,
+    ):
+        """Instantiate AsyncSupabaseAuthClient instance."""
+        AsyncGoTrueClient.__init__(
+            self,
+            url=url,
+            headers=headers,
+            storage_key=storage_key,
+            auto_refresh_token=auto_refresh_token,
+            persist_session=persist_session,
+            storage=storage,
+            http_client=http_client,
+        )
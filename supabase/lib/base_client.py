@@ -0,0 +1,271 @@
+import dataclasses
+import string
+from abc import ABC, abstractmethod
+from typing import Dict, Generic, Optional, Type, TypeVar, Union
+
+from httpx import AsyncBaseTransport, BaseTransport, Request, Response, Timeout
+from supafunc import FunctionsClient
+
+from .client_options import ClientOptions
+
+_JWT_SEGMENT_CHARS = f"{string.ascii_letters}{string.digits}-_=".encode()
+_JWT_SIGNATURE_CHARS = _JWT_SEGMENT_CHARS + b".+/"
+_PLATFORM_DOMAINS = (".supabase.co", ".supabase.in")
+
+
+def _is_valid_jwt(key: str) -> bool:
+    """Check that `key` is shaped like a JWT (`header.payload[.signature]`).
+
+    Accepts what `^[A-Za-z0-9-_=]+\\.[A-Za-z0-9-_=]+\\.?[A-Za-z0-9-_.+/=]*$`
+    used to, except that a trailing newline (which `$` let through) is now
+    rejected. Done with `bytes.translate` so no regex engine is involved.
+    """
+    if not key.isascii():
+        return False
+    header, _, rest = key.encode().partition(b".")
+    return bool(
+        header
+        and rest
+        and not header.translate(None, _JWT_SEGMENT_CHARS)
+        and not rest[:1].translate(None, _JWT_SEGMENT_CHARS)
+        and not rest.translate(None, _JWT_SIGNATURE_CHARS)
+    )
+
+
+class SharedTransport(BaseTransport):
+    """Transport handed to the sub-clients of a `Client`.
+
+    Requests go to the wrapped pool, but `close()` does nothing: closing one
+    sub-client's session must not drop the connections its siblings are using.
+    The owning client closes the wrapped transport itself.
+    """
+
+    def __init__(self, transport: BaseTransport):
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncSharedTransport(AsyncBaseTransport):
+    """Async counterpart of `SharedTransport`."""
+
+    def __init__(self, transport: AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+# Create an exception class when user does not provide a valid url or key.
+class SupabaseException(Exception):
+    pass
+
+
+_Options = TypeVar("_Options", bound=ClientOptions)
+_Transport = TypeVar("_Transport", SharedTransport, AsyncSharedTransport)
+_Auth = TypeVar("_Auth")
+_Postgrest = TypeVar("_Postgrest")
+_Storage = TypeVar("_Storage")
+
+
+class SupabaseClientBase(
+    ABC, Generic[_Options, _Transport, _Auth, _Postgrest, _Storage]
+):
+    """Shared state and behaviour of the sync and async Supabase clients.
+
+    Subclasses provide the transport and the `_init_*` sub-client factories,
+    and bind the type parameters to their options, transport and sub-client
+    classes.
+    Instances use `__slots__`, so attributes beyond the ones listed there cannot
+    be set on them; subclass the client to add more.
+    """
+
+    __slots__ = (
+        "supabase_url",
+        "supabase_key",
+        "options",
+        "rest_url",
+        "realtime_url",
+        "auth_url",
+        "storage_url",
+        "functions_url",
+        "schema",
+        "realtime",
+        "_transport",
+        "_auth",
+        "_postgrest",
+        "_storage",
+        "_functions",
+    )
+
+    _options_class: Type[_Options]
+
+    def __init__(
+        self,
+        supabase_url: str,
+        supabase_key: str,
+        options: Optional[_Options] = None,
+    ):
+        """Instantiate the client.
+
+        Parameters
+        ----------
+        supabase_url: str
+            The URL to the Supabase instance that should be connected to.
+        supabase_key: str
+            The API key to the Supabase instance that should be connected to.
+        **options
+            Any extra settings to be optionally specified - also see the
+            `DEFAULT_OPTIONS` dict.
+        """
+
+        if not supabase_url:
+            raise SupabaseException("supabase_url is required")
+        if not supabase_key:
+            raise SupabaseException("supabase_key is required")
+
+        # Check if the url and key are valid
+        scheme, _, host = supabase_url.partition("://")
+        if scheme not in ("http", "https") or not host:
+            raise SupabaseException("Invalid URL")
+
+        # Check if the key is a valid JWT
+        if not _is_valid_jwt(supabase_key):
+            raise SupabaseException("Invalid API key")
+
+        self.supabase_url = supabase_url
+        self.supabase_key = supabase_key
+        if options is None:
+            options = self._options_class()
+        # Work on a copy so the caller's options (and their headers dict) are
+        # never mutated. The auth headers are built only here; every sub-client
+        # reads them back from `self.options.headers`.
+        self.options = dataclasses.replace(
+            options, headers={**options.headers, **self._get_auth_headers()}
+        )
+        self.rest_url: str = f"{supabase_url}/rest/v1"
+        # The URL was validated to start with http(s)://, so swapping the first
+        # four characters turns it into ws(s)://.
+        self.realtime_url: str = f"ws{supabase_url[4:]}/realtime/v1"
+        self.auth_url: str = f"{supabase_url}/auth/v1"
+        self.storage_url = f"{supabase_url}/storage/v1"
+        if supabase_url.endswith(_PLATFORM_DOMAINS):
+            project_url, _, platform_domain = supabase_url.partition(".")
+            self.functions_url = f"{project_url}.functions.{platform_domain}"
+        else:
+            self.functions_url = f"{supabase_url}/functions/v1"
+        self.schema: str = self.options.schema
+
+        # Sub-clients are created on first access. They all talk to the same
+        # Supabase host, so they share one transport (and connection pool) and
+        # multiplex their requests over HTTP/2 where the server supports it.
+        # The transport is created lazily too, as setting it up loads an SSL
+        # context.
+        self._transport: Optional[_Transport] = None
+        self._auth: Optional[_Auth] = None
+        self._postgrest: Optional[_Postgrest] = None
+        self._storage: Optional[_Storage] = None
+        self._functions: Optional[FunctionsClient] = None
+        # TODO: Bring up to parity with JS client.
+        self.realtime = None
+
+    @property
+    def auth(self) -> _Auth:
+        """The auth client, created on first access."""
+        if self._auth is None:
+            self._auth = self._init_supabase_auth_client(
+                auth_url=self.auth_url,
+                client_options=self.options,
+                transport=self._get_transport(),
+            )
+        return self._auth
+
+    @property
+    def postgrest(self) -> _Postgrest:
+        """The PostgREST client, created on first access."""
+        if self._postgrest is None:
+            self._postgrest = self._init_postgrest_client(
+                rest_url=self.rest_url,
+                supabase_key=self.supabase_key,
+                headers=self.options.headers,
+                schema=self.options.schema,
+                timeout=self.options.postgrest_client_timeout,
+                transport=self._get_transport(),
+            )
+        return self._postgrest
+
+    @property
+    def storage(self) -> _Storage:
+        """The storage client, created on first access."""
+        if self._storage is None:
+            self._storage = self._init_storage_client(
+                self.storage_url,
+                self.options.headers,
+                self.options.storage_client_timeout,
+                transport=self._get_transport(),
+            )
+        return self._storage
+
+    def functions(self) -> FunctionsClient:
+        """Return the edge functions client, creating it on first use."""
+        if self._functions is None:
+            # `FunctionsClient.set_auth` mutates the dict it was given.
+            self._functions = FunctionsClient(
+                self.functions_url, dict(self.options.headers)
+            )
+        return self._functions
+
+    def _get_transport(self) -> _Transport:
+        """Return the transport shared by the sub-clients, creating it if needed."""
+        if self._transport is None:
+            self._transport = self._create_transport()
+        return self._transport
+
+    @abstractmethod
+    def _create_transport(self) -> _Transport:
+        """Create the transport shared by the sub-clients."""
+
+    @staticmethod
+    @abstractmethod
+    def _init_storage_client(
+        storage_url: str,
+        headers: Dict[str, str],
+        storage_client_timeout: int,
+        transport: Optional[_Transport] = None,
+    ) -> _Storage:
+        """Create the storage client."""
+
+    @staticmethod
+    @abstractmethod
+    def _init_supabase_auth_client(
+        auth_url: str,
+        client_options: _Options,
+        transport: Optional[_Transport] = None,
+    ) -> _Auth:
+        """Create the auth client."""
+
+    @staticmethod
+    @abstractmethod
+    def _init_postgrest_client(
+        rest_url: str,
+        supabase_key: str,
+        headers: Dict[str, str],
+        schema: str,
+        timeout: Union[int, float, Timeout],
+        transport: Optional[_Transport] = None,
+    ) -> _Postgrest:
+        """Create the PostgREST client."""
+
+    def _get_auth_headers(self) -> Dict[str, str]:
+        """Helper method to get auth headers."""
+        return {
+            "apiKey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}",
+        }
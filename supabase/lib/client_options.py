@@ -1,7 +1,12 @@
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Optional, Union
 
-from gotrue import SyncMemoryStorage, SyncSupportedStorage
+from gotrue import (
+    AsyncMemoryStorage,
+    AsyncSupportedStorage,
+    SyncMemoryStorage,
+    SyncSupportedStorage,
+)
 from httpx import Timeout
 from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
 from storage3.constants import DEFAULT_TIMEOUT as DEFAULT_STORAGE_CLIENT_TIMEOUT
@@ -62,7 +67,7 @@ class ClientOptions:
         ] = DEFAULT_STORAGE_CLIENT_TIMEOUT,
     ) -> "ClientOptions":
         """Create a new SupabaseClientOptions with changes"""
-        client_options = ClientOptions()
+        client_options = type(self)()
         client_options.schema = schema or self.schema
         client_options.headers = headers or self.headers
         client_options.auto_refresh_token = (
@@ -79,3 +84,9 @@ class ClientOptions:
             storage_client_timeout or self.storage_client_timeout
         )
         return client_options
+
+
+@dataclass
+class AsyncClientOptions(ClientOptions):
+    storage: AsyncSupportedStorage = field(default_factory=AsyncMemoryStorage)
+    """A storage provider. Used to store the logged in session."""
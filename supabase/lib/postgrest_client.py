@@ -0,0 +1,81 @@
+from typing import Dict, Optional, Union
+
+from httpx import AsyncBaseTransport, BaseTransport, Timeout
+from postgrest import AsyncPostgrestClient, SyncPostgrestClient
+from postgrest.constants import (
+    DEFAULT_POSTGREST_CLIENT_HEADERS,
+    DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+)
+from postgrest.utils import AsyncClient, SyncClient
+
+
+class SupabasePostgrestClient(SyncPostgrestClient):
+    """PostgREST client that can share a transport with other sub-clients."""
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        schema: str = "public",
+        headers: Dict[str, str] = DEFAULT_POSTGREST_CLIENT_HEADERS,
+        timeout: Union[int, float, Timeout] = DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+        transport: Optional[BaseTransport] = None,
+    ):
+        """Instantiate SupabasePostgrestClient instance."""
+        self._transport = transport
+        SyncPostgrestClient.__init__(
+            self,
+            base_url,
+            schema=schema,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    def create_session(
+        self,
+        base_url: str,
+        headers: Dict[str, str],
+        timeout: Union[int, float, Timeout],
+    ) -> SyncClient:
+        return SyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=self._transport,
+        )
+
+
+class AsyncSupabasePostgrestClient(AsyncPostgrestClient):
+    """Async PostgREST client that can share a transport with other sub-clients."""
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        schema: str = "public",
+        headers: Dict[str, str] = DEFAULT_POSTGREST_CLIENT_HEADERS,
+        timeout: Union[int, float, Timeout] = DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+        transport: Optional[AsyncBaseTransport] = None,
+    ):
+        """Instantiate AsyncSupabasePostgrestClient instance."""
+        self._transport = transport
+        AsyncPostgrestClient.__init__(
+            self,
+            base_url,
+            schema=schema,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    def create_session(
+        self,
+        base_url: str,
+        headers: Dict[str, str],
+        timeout: Union[int, float, Timeout],
+    ) -> AsyncClient:
+        return AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=self._transport,
+        )
@@ -1,11 +1,70 @@
+from typing import Dict, Optional
+
 from deprecation import deprecated
-from storage3 import SyncStorageClient
+from httpx import AsyncBaseTransport, BaseTransport
+from storage3 import AsyncStorageClient, SyncStorageClient
 from storage3._sync.file_api import SyncBucketProxy
+from storage3.constants import DEFAULT_TIMEOUT
+from storage3.utils import AsyncClient, SyncClient
 
 
 class SupabaseStorageClient(SyncStorageClient):
     """Manage storage buckets and files."""
 
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: int = DEFAULT_TIMEOUT,
+        transport: Optional[BaseTransport] = None,
+    ):
+        """Instantiate SupabaseStorageClient instance.
+
+        `transport` lets the storage session share its connection pool with
+        the other Supabase sub-clients.
+        """
+        self._transport = transport
+        SyncStorageClient.__init__(self, url, headers, timeout)
+
+    def _create_session(
+        self, base_url: str, headers: Dict[str, str], timeout: int
+    ) -> SyncClient:
+        return SyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=self._transport,
+        )
+
     @deprecated("0.5.4", "0.6.0", details="Use `.from_()` instead")
     def StorageFileAPI(self, id_: str) -> SyncBucketProxy:
         return super().from_(id_)
+
+
+class AsyncSupabaseStorageClient(AsyncStorageClient):
+    """Manage storage buckets and files asynchronously."""
+
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: int = DEFAULT_TIMEOUT,
+        transport: Optional[AsyncBaseTransport] = None,
+    ):
+        """Instantiate AsyncSupabaseStorageClient instance.
+
+        `transport` lets the storage session share its connection pool with
+        the other Supabase sub-clients.
+        """
+        self._transport = transport
+        AsyncStorageClient.__init__(self, url, headers, timeout)
+
+    def _create_session(
+        self, base_url: str, headers: Dict[str, str], timeout: int
+    ) -> AsyncClient:
+        return AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=self._transport,
+        )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from supabase import AsyncClient, create_async_client
+from supabase.client import SupabaseException
+
+KEY = "xxxxxxxxxxxxxx.xxxxxxxxxxxxxxx.xxxxxxxxxxxxxxx"
+
+
+def test_create_async_client() -> None:
+    client = create_async_client("https://localhost:54322", KEY)
+    assert isinstance(client, AsyncClient)
+    assert client.realtime_url == "wss://localhost:54322/realtime/v1"
+    assert client.functions_url == "https://localhost:54322/functions/v1"
+    assert not hasattr(client, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "url, key",
+    [("", KEY), ("localhost:54322", KEY), ("https://localhost:54322", "invalid")],
+)
+def test_invalid_values_raise(url: str, key: str) -> None:
+    with pytest.raises(SupabaseException):
+        create_async_client(url, key)
+
+
+def test_sub_clients_share_transport() -> None:
+    client = create_async_client("https://localhost:54322", KEY)
+
+    assert client.postgrest.session._transport is client._transport
+    assert client.storage.session._transport is client._transport
+    assert client.auth._http_client._transport is client._transport
+
+
+def test_context_manager_closes_transport(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed = []
+    client = create_async_client("https://localhost:54322", KEY)
+
+    async def aclose() -> None:
+        closed.append(True)
+
+    monkeypatch.setattr(client._get_transport().transport, "aclose", aclose)
+
+    async def run() -> None:
+        async with client:
+            await client.postgrest.aclose()
+            assert closed == []
+
+    asyncio.run(run())
+    assert closed == [True]
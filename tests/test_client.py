@@ -4,6 +4,8 @@ from typing import Any
 
 import pytest
 
+KEY = "xxxxxxxxxxxxxx.xxxxxxxxxxxxxxx.xxxxxxxxxxxxxxx"
+
 
 @pytest.mark.xfail(
     reason="None of these values should be able to instantiate a client object"
@@ -15,3 +17,190 @@ def test_incorrect_values_dont_instantiate_client(url: Any, key: Any) -> None:
     from supabase import Client, create_client
 
     _: Client = create_client(url, key)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "xxxxxxxxxxxxxx.xxxxxxxxxxxxxxx",
+        "xxxxxxxxxxxxxx.xxxxxxxxxxxxxxx.xxxxxxxxxxxxxxx",
+        "eyJhbGciOi-_=.eyJyb2xlIjo-_=.abc+/=.def",
+    ],
+)
+def test_valid_keys_instantiate_client(key: str) -> None:
+    from supabase import Client, create_client
+
+    client = create_client("https://localhost:54322", key)
+    assert isinstance(client, Client)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "xxxxxxxxxxxxxx",
+        ".xxxxxxxxxxxxxxx",
+        "xxxxxxxxxxxxxx.",
+        "xxxxxxxxxxxxxx..xxxxxxxxxxxxxxx",
+        "xxxxxxxxxxxxxx.+xxxxxxxxxxxxxx",
+        "xxxxxxxxxxxxxx.xxxxxxxxxxxxxxx.xxx xxx",
+        "xxxxxxxxxxxxxx.xxxxxxxxxxxxxxx.xxxxxxé",
+        "xxxxxxxxxxxxxx.xxxxxxxxxxxxxxx\n",
+    ],
+)
+def test_invalid_keys_raise(key: str) -> None:
+    from supabase import create_client
+    from supabase.client import SupabaseException
+
+    with pytest.raises(SupabaseException, match="Invalid API key"):
+        create_client("https://localhost:54322", key)
+
+
+def test_sub_clients_share_transport() -> None:
+    from supabase import create_client
+
+    client = create_client("https://localhost:54322", KEY)
+
+    assert client.postgrest.session._transport is client._transport
+    assert client.storage.session._transport is client._transport
+    assert client.auth._http_client._transport is client._transport
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://localhost:54322", "wss://localhost:54322/realtime/v1"),
+        ("http://localhost:54322", "ws://localhost:54322/realtime/v1"),
+        ("http://localhost/http-proxy", "ws://localhost/http-proxy/realtime/v1"),
+    ],
+)
+def test_realtime_url(url: str, expected: str) -> None:
+    from supabase import create_client
+
+    assert create_client(url, KEY).realtime_url == expected
+
+
+def test_sub_clients_are_created_lazily() -> None:
+    from supabase import create_client
+
+    client = create_client("https://localhost:54322", KEY)
+    assert client._transport is None
+    assert client._auth is None
+    assert client._postgrest is None
+    assert client._storage is None
+
+    client.table("countries")
+    assert client._transport is not None
+    assert client._postgrest is client.postgrest
+    assert client._auth is None
+    assert client._storage is None
+
+
+@pytest.mark.parametrize(
+    "url", ["localhost:54322", "https://", "ftp://localhost", "https//localhost"]
+)
+def test_invalid_urls_raise(url: str) -> None:
+    from supabase import create_client
+    from supabase.client import SupabaseException
+
+    with pytest.raises(SupabaseException, match="Invalid URL"):
+        create_client(url, KEY)
+
+
+def test_cached_clients_are_reused() -> None:
+    from supabase import create_client
+    from supabase.lib.client_options import ClientOptions
+
+    url = "https://localhost:54322"
+    options = ClientOptions()
+
+    client = create_client(url, KEY, options, cached=True)
+    assert create_client(url, KEY, options, cached=True) is client
+    assert create_client(url, KEY, options) is not client
+    assert create_client(url, KEY, ClientOptions(), cached=True) is not client
+
+
+def test_client_does_not_mutate_options() -> None:
+    from supabase import create_client
+    from supabase.lib.client_options import ClientOptions
+
+    options = ClientOptions(headers={"X-Custom": "value"})
+    client = create_client("https://localhost:54322", KEY, options)
+
+    assert options.headers == {"X-Custom": "value"}
+    assert client.options.headers["X-Custom"] == "value"
+    assert client.options.headers["Authorization"] == f"Bearer {KEY}"
+
+
+def test_client_has_no_instance_dict() -> None:
+    from supabase import create_client
+
+    client = create_client("https://localhost:54322", KEY)
+
+    assert not hasattr(client, "__dict__")
+    with pytest.raises(AttributeError):
+        client.unknown_attribute = None
+
+
+def test_only_the_client_closes_the_shared_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from supabase import create_client
+
+    client = create_client("https://localhost:54322", KEY)
+    closed = []
+    monkeypatch.setattr(
+        client._get_transport().transport, "close", lambda: closed.append(1)
+    )
+
+    with client:
+        with client.postgrest:
+            client.table("countries")
+        client.storage.aclose()
+        client.auth.close()
+        assert closed == []
+    assert closed == [1]
+
+
+def test_sub_clients_reuse_auth_headers() -> None:
+    from supabase import create_client
+
+    client = create_client("https://localhost:54322", KEY)
+
+    assert client.storage.session.headers["Authorization"] == f"Bearer {KEY}"
+    functions = client.functions()
+    assert functions.headers["apiKey"] == KEY
+    functions.set_auth("user-token")
+    assert client.options.headers["Authorization"] == f"Bearer {KEY}"
+
+
+def test_cached_client_without_options_is_reused() -> None:
+    from supabase import create_client
+
+    client = create_client("https://localhost:54322", KEY, cached=True)
+    assert create_client("https://localhost:54322", KEY, cached=True) is client
+    assert create_client("https://localhost:54322", KEY, None, cached=True) is client
+
+
+def test_client_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from collections import OrderedDict
+
+    from supabase import client as client_module
+    from supabase import create_client
+
+    monkeypatch.setattr(client_module, "_client_cache", OrderedDict())
+    urls = [
+        f"https://localhost:{port}"
+        for port in range(client_module._CLIENT_CACHE_SIZE + 1)
+    ]
+
+    oldest, recent = (create_client(url, KEY, cached=True) for url in urls[:2])
+    # Touch `recent` so that `oldest` is the least recently used entry.
+    assert create_client(urls[1], KEY, cached=True) is recent
+    for url in urls[2:]:
+        create_client(url, KEY, cached=True)
+
+    assert len(client_module._client_cache) == client_module._CLIENT_CACHE_SIZE
+    assert create_client(urls[1], KEY, cached=True) is recent
+    assert create_client(urls[0], KEY, cached=True) is not oldest
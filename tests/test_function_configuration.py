@@ -7,9 +7,13 @@ def test_functions_client_initialization() -> None:
     # Sample JWT Key
     key = "xxxxxxxxxxxxxx.xxxxxxxxxxxxxxx.xxxxxxxxxxxxxxx"
     sp = supabase.Client(url, key)
-    sp.functions()
+    assert sp.functions() is sp.functions()
     assert sp.functions_url == f"https://{ref}.functions.supabase.co"
 
     url = "https://localhost:54322"
     sp_local = supabase.Client(url, key)
     assert sp_local.functions_url == f"{url}/functions/v1"
+
+    url = f"https://{ref}.supabase.in"
+    sp_in = supabase.Client(url, key)
+    assert sp_in.functions_url == f"https://{ref}.functions.supabase.in"